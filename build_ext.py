@@ -0,0 +1,20 @@
+"""
+build_ext.py: Ahead-of-time compiles the plating metric kernel from formulas.py
+into the `plating_ext` extension module using Numba's pycc.
+
+Run once at build time (python build_ext.py) on the target platform; formulas.py
+then imports the precompiled kernel and the Raspberry Pi needs no JIT compile
+(or LLVM) at startup. Without the extension, formulas.py falls back to Numba JIT
+or pure Python.
+"""
+
+from numba.pycc import CC
+
+from formulas import _KERNEL_SIGNATURE, _py_calc_metrics
+
+cc = CC("plating_ext")
+cc.export("calc_metrics", _KERNEL_SIGNATURE)(_py_calc_metrics)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -3,8 +3,22 @@ formulas.py: Utility module for calculating electroplating metrics
 and formatting time values.
 """
 
+import functools
 import math
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional (e.g. no wheel for the target ARM build); fall back to
+    # the pure-Python kernel below.
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is only needed for PlatingCalculator.calculate_metrics_batch
+    np = None
+
 
 def format_time(seconds):
     """Converts seconds into HH:MM:SS format."""
@@ -12,15 +26,19 @@ def format_time(seconds):
         seconds = int(seconds)
         if seconds < 0:
             return "00:00:00"
-
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        sec = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{sec:02d}"
+        return _fmt(seconds)
     except (TypeError, ValueError):
         return "N/A"
 
 
+@functools.lru_cache(maxsize=8192)
+def _fmt(seconds):
+    """Memoized HH:MM:SS formatting of a non-negative integer second count."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, sec = divmod(remainder, 60)
+    return "%02d:%02d:%02d" % (hours, minutes, sec)
+
+
 class PlatingCalculator:
     # Conceptual constants for a generic plating material (e.g., Gold/Nickel blend)
     # These constants are for simulation purposes.
@@ -32,6 +50,12 @@ class PlatingCalculator:
     # Faraday constant (C/mol)
     F = 96485.0
 
+    # Faraday's Law folded into one constant: Time (s) = K * thickness_um * area / I
+    # K = (rho * n * F) / (M * E * 10000), where 10000 converts $\mu$m to cm
+    _TIME_K = (DENSITY_G_CM3 * CHARGE_VALENCE * F) / (
+        MOLAR_MASS_G_MOL * CURRENT_EFFICIENCY * 10000.0
+    )
+
     # Recommended Current Density (mA/cm^2) based on complexity
     # Higher complexity requires lower current density to ensure even coverage
     CURRENT_DENSITY_MAP = {
@@ -42,6 +66,16 @@ class PlatingCalculator:
         5: 2.0,  # Highly Detailed
     }
 
+    # Per-complexity constants folded at import time, indexed by complexity - 1:
+    # (current density in A/cm^2, target voltage in V, display name)
+    COMPLEXITY_TABLE = tuple(
+        (density_mA_cm2 / 1000.0, 2.0 * (1.0 + (level - 1) * 0.2), name)
+        for (level, density_mA_cm2), name in zip(
+            sorted(CURRENT_DENSITY_MAP.items()),
+            ("Basic", "Simple", "Moderate", "Complex", "Highly Detailed"),
+        )
+    )
+
     @staticmethod
     def calculate_metrics(thickness_um, area_cm2, complexity_level):
         """
@@ -56,44 +90,11 @@ class PlatingCalculator:
         - dict: Contains 'target_current_A', 'target_voltage_V', 'estimated_time_sec'
         """
         try:
-            # 1. Calculate Target Current (Amps)
-            density_mA_cm2 = PlatingCalculator.CURRENT_DENSITY_MAP.get(
-                complexity_level, PlatingCalculator.CURRENT_DENSITY_MAP[1]
-            )
-            # Convert mA/cm^2 to A
-            target_current_A = (density_mA_cm2 / 1000.0) * area_cm2
-
-            # 2. Calculate Plating Mass (grams)
-            thickness_cm = thickness_um / 10000.0  # $\mu$m to cm
-            volume_cm3 = thickness_cm * area_cm2
-            target_mass_g = volume_cm3 * PlatingCalculator.DENSITY_G_CM3
-
-            # 3. Calculate Estimated Time (Seconds) based on Faraday's Law
-            # Time (s) = (Mass * n * F) / (M * I * E)
-            # where:
-            #   Mass (g) = target_mass_g
-            #   n = CHARGE_VALENCE
-            #   F = Faraday constant
-            #   M = MOLAR_MASS_G_MOL
-            #   I = target_current_A
-            #   E = CURRENT_EFFICIENCY
-
-            numerator = (
-                target_mass_g * PlatingCalculator.CHARGE_VALENCE * PlatingCalculator.F
-            )
-            denominator = (
-                PlatingCalculator.MOLAR_MASS_G_MOL
-                * target_current_A
-                * PlatingCalculator.CURRENT_EFFICIENCY
+            # Keyed on the raw inputs: rounding to fixed decimals would zero out
+            # (or skew) small but valid areas and thicknesses
+            target_current_A, target_voltage_V, estimated_time_sec = _calc(
+                thickness_um, area_cm2, complexity_level
             )
-
-            estimated_time_sec = numerator / denominator
-
-            # 4. Calculate Target Voltage (Simple scaling for simulation)
-            # Base voltage (e.g., 2.0V) + complexity factor
-            voltage_factor = 1.0 + (complexity_level - 1) * 0.2
-            target_voltage_V = 2.0 * voltage_factor
-
             return {
                 "target_current_A": target_current_A,
                 "target_voltage_V": target_voltage_V,
@@ -108,6 +109,108 @@ class PlatingCalculator:
                 "estimated_time_sec": 0,
             }
 
+    @staticmethod
+    def calculate_metrics_batch(thickness_um, area_cm2, complexity_level):
+        """
+        Vectorized calculate_metrics for parameter sweeps (requires NumPy).
+
+        Inputs are array-likes broadcast against each other, e.g. a grid of
+        thicknesses x areas x complexity levels. Entries with zero current
+        (invalid area) yield zeros, like calculate_metrics.
+
+        Returns:
+        - dict: Same keys as calculate_metrics, each holding an ndarray
+        """
+        if np is None:
+            raise ImportError("calculate_metrics_batch requires NumPy")
+
+        thickness_um, area_cm2, complexity_level = np.broadcast_arrays(
+            np.asarray(thickness_um, dtype=float),
+            np.asarray(area_cm2, dtype=float),
+            np.asarray(complexity_level).astype(int),
+        )
+        # Same rules as the scalar kernel: out-of-range levels use the Basic
+        # density and the voltage formula on the raw level
+        in_range = (complexity_level >= 1) & (complexity_level <= 5)
+        index = np.where(in_range, complexity_level, 1)
+        target_current_A = np.asarray(_DENSITY_A_CM2)[index] * area_cm2
+        target_voltage_V = np.where(
+            in_range,
+            np.asarray(_VOLTAGE_V)[index],
+            2.0 * (1.0 + (complexity_level - 1) * 0.2),
+        )
+        valid = target_current_A != 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            estimated_time_sec = np.where(
+                valid, _TIME_K * thickness_um * area_cm2 / target_current_A, 0.0
+            )
+
+        return {
+            "target_current_A": target_current_A,
+            "target_voltage_V": np.where(valid, target_voltage_V, 0.0),
+            "estimated_time_sec": estimated_time_sec,
+        }
+
+
+@functools.lru_cache(maxsize=256)
+def _calc(thickness_um, area_cm2, complexity_level):
+    """
+    Memoized core of PlatingCalculator.calculate_metrics.
+
+    Returns:
+    - tuple: (target_current_A, target_voltage_V, estimated_time_sec)
+    """
+    # Coerce to plain scalars here so bad input raises ValueError/TypeError
+    # before reaching the (possibly compiled) kernel
+    return _calc_metrics(float(thickness_um), float(area_cm2), int(complexity_level))
+
+
+# Flat copies of COMPLEXITY_TABLE; Numba freezes module globals as constants.
+# Indexed directly by complexity level, with slot 0 mirroring level 1 (Basic).
+# Current density in A/cm^2 (CURRENT_DENSITY_MAP / 1000)
+_DENSITY_A_CM2 = (0.005, 0.005, 0.004, 0.003, 0.0025, 0.002)
+# Target voltage in V: 2.0 * (1.0 + (level - 1) * 0.2)
+_VOLTAGE_V = (2.0, 2.0, 2.4, 2.8, 3.2, 3.6)
+_TIME_K = PlatingCalculator._TIME_K
+
+# Numba type signature of the kernel, shared with the AOT build in build_ext.py
+_KERNEL_SIGNATURE = "UniTuple(float64, 3)(float64, float64, int64)"
+
+
+def _py_calc_metrics(thickness_um, area_cm2, complexity_level):
+    """Arithmetic kernel for _calc; compiled with Numba when available."""
+    # 1. Look up precomputed density (A/cm^2) and voltage. Out-of-range levels
+    # use the Basic density but still scale the voltage from the raw level.
+    if 1 <= complexity_level <= 5:
+        target_current_A = _DENSITY_A_CM2[complexity_level] * area_cm2
+        target_voltage_V = _VOLTAGE_V[complexity_level]
+    else:
+        target_current_A = _DENSITY_A_CM2[1] * area_cm2
+        target_voltage_V = 2.0 * (1.0 + (complexity_level - 1) * 0.2)
+
+    # 2. Calculate Estimated Time (Seconds) based on Faraday's Law
+    # Time (s) = (Mass * n * F) / (M * I * E), with Mass = rho * thickness * area
+    # and all material constants pre-folded into _TIME_K. Area is kept in the
+    # numerator so a zero area still raises ZeroDivisionError (invalid input).
+    estimated_time_sec = _TIME_K * thickness_um * area_cm2 / target_current_A
+
+    return target_current_A, target_voltage_V, estimated_time_sec
+
+
+try:
+    # Ahead-of-time compiled kernel produced by build_ext.py; no JIT at startup
+    from plating_ext import calc_metrics as _calc_metrics
+except ImportError:
+    if njit is not None:
+        # An explicit signature compiles eagerly at import and skips per-call type
+        # dispatch; cache=True persists the result so the compile is paid once
+        _calc_metrics = njit(_KERNEL_SIGNATURE, cache=True, fastmath=True)(
+            _py_calc_metrics
+        )
+    else:
+        _calc_metrics = _py_calc_metrics
+
 
 if __name__ == "__main__":
     # Simple test case
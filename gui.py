@@ -8,6 +8,12 @@ electroplating system, optimized for a Raspberry Pi 5 with a compact
 Uses Kivy for touch-friendly interface.
 """
 
+import logging
+import queue
+import threading
+import time
+from functools import partial
+
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
@@ -35,6 +41,14 @@ WINDOW_HEIGHT = 320
 Window.size = (WINDOW_WIDTH, WINDOW_HEIGHT)
 Window.allow_resize = False
 
+# How often the background thread polls the PSU for live readings (seconds)
+PSU_POLL_INTERVAL_SEC = 1.0
+
+# Readout templates, formatted with % on the 1 Hz live monitor path
+_VOLT_FMT = "%.2f V"
+_CURR_FMT = "%.3f A"
+_STATUS_FMT = "%s (%d%%)"
+
 
 # --- Kivy App Class ---
 class ElectroplatingControllerApp(App):
@@ -49,6 +63,7 @@ class ElectroplatingControllerApp(App):
         self.progress_percent = 0
         self.time_elapsed_sec = 0
         self.is_plating_active = False
+        self._pct_per_sec = 0.0  # Progress gained per elapsed second of plating
 
         self.target_current_A = 0.0
         self.target_voltage_V = 0.0
@@ -58,6 +73,18 @@ class ElectroplatingControllerApp(App):
         self.psu_interface = PowerSupplyInterface()
         self.live_update_event = None
 
+        # Readout values queued by live_monitor, applied together on the next frame
+        self._pending = {}
+        self._flush_trigger = Clock.create_trigger(self._flush_pending)
+
+        # PSU reads run on a background thread so serial I/O never blocks the UI.
+        # The size-1 queue holds only the freshest (V, A, status) sample.
+        self._psu_q = queue.Queue(maxsize=1)
+        self._psu_sample = (0.0, 0.0, "PLATING ACTIVE")
+        self._psu_run = threading.Event()
+        self._psu_thread = threading.Thread(target=self._psu_poll_loop, daemon=True)
+        self._psu_thread.start()
+
         # 2. Main Layout (Vertical, 480x320)
         main_layout = BoxLayout(
             orientation="vertical",
@@ -80,10 +107,8 @@ class ElectroplatingControllerApp(App):
             self.input_rect = RoundedRectangle(
                 size=input_section.size, pos=input_section.pos, radius=[dp(8)]
             )
-        input_section.bind(
-            size=lambda *x: setattr(self.input_rect, "size", x[0].size),
-            pos=lambda *x: setattr(self.input_rect, "pos", x[0].pos),
-        )
+        sync_input_rect = partial(self._sync_rect, self.input_rect)
+        input_section.bind(size=sync_input_rect, pos=sync_input_rect)
 
         # Thickness Input
         input_section.add_widget(
@@ -214,6 +239,8 @@ class ElectroplatingControllerApp(App):
         main_layout.add_widget(control_section)
 
         # 3. Initial Calculations and Setup
+        self._create_message_modal()
+        self._create_confirm_modal()
         self.update_calculations()
 
         return main_layout
@@ -287,10 +314,8 @@ class ElectroplatingControllerApp(App):
         with box.canvas.before:
             Color(0.2, 0.2, 0.3, 1)
             rect = RoundedRectangle(size=box.size, pos=box.pos, radius=[dp(4)])
-        box.bind(
-            size=lambda instance, value: setattr(rect, "size", value),
-            pos=lambda instance, value: setattr(rect, "pos", value),
-        )
+        sync_rect = partial(self._sync_rect, rect)
+        box.bind(size=sync_rect, pos=sync_rect)
 
         box.add_widget(
             Label(
@@ -303,6 +328,11 @@ class ElectroplatingControllerApp(App):
         box.add_widget(value_label)
         return value_label  # Return the value label so we can update its text
 
+    def _sync_rect(self, rect, instance, value):
+        """Keeps a background rectangle aligned with its widget's size and pos."""
+        rect.size = instance.size
+        rect.pos = instance.pos
+
     def _create_control_button(self, text, on_press_callback, color):
         """Creates a styled, touch-friendly control button."""
         button = Button(
@@ -327,31 +357,116 @@ class ElectroplatingControllerApp(App):
 
         return button
 
-    def show_modal(self, title, message, is_error=False, callback=None):
-        """Displays a custom modal message instead of alert()."""
-        modal = ModalView(
+    def _create_message_modal(self):
+        """Builds the reusable message modal once; show_modal fills it in."""
+        self._message_modal = ModalView(
             size_hint=(0.85, 0.45),  # Slightly larger modal
             auto_dismiss=False,
             background_color=(0.1, 0.1, 0.2, 0.9),
         )
+        self._message_callback = None
         layout = BoxLayout(orientation="vertical", padding=dp(10), spacing=dp(10))
 
-        color = (0.8, 0.2, 0.2, 1) if is_error else (0.2, 0.8, 0.2, 1)
+        self._message_title_label = Label(font_size="18dp", size_hint_y=0.2)
+        self._message_body_label = Label(
+            font_size="11dp", color=(1, 1, 1, 1), size_hint_y=0.6
+        )
+        self._message_ok_btn = self._create_control_button(
+            "OK", self._on_message_ok, (0.2, 0.8, 0.2, 1)
+        )
 
-        layout.add_widget(
-            Label(text=title, font_size="18dp", color=color, size_hint_y=0.2)
+        layout.add_widget(self._message_title_label)
+        layout.add_widget(self._message_body_label)
+        layout.add_widget(self._message_ok_btn)
+        self._message_modal.add_widget(layout)
+
+    def _create_confirm_modal(self):
+        """Builds the reusable start confirmation modal once."""
+        self._confirm_modal = ModalView(
+            size_hint=(0.85, 0.5),
+            auto_dismiss=False,
+            background_color=(0.1, 0.1, 0.2, 0.9),
         )
+        layout = BoxLayout(orientation="vertical", padding=dp(10), spacing=dp(10))
+
         layout.add_widget(
-            Label(text=message, font_size="11dp", color=(1, 1, 1, 1), size_hint_y=0.6)
+            Label(
+                text="START CONFIRMATION",
+                font_size="16dp",
+                color=(0.7, 0.9, 0.7, 1),
+                size_hint_y=0.2,
+            )
+        )
+        self._confirm_body_label = Label(
+            font_size="11dp", color=(1, 1, 1, 1), size_hint_y=0.5
         )
+        layout.add_widget(self._confirm_body_label)
 
-        close_btn = self._create_control_button("OK", modal.dismiss, color)
-        if callback:
-            close_btn.bind(on_press=callback)
+        btn_layout = BoxLayout(spacing=dp(10), size_hint_y=0.3)
+        cancel_btn = self._create_control_button(
+            "CANCEL", self._confirm_modal.dismiss, (0.8, 0.3, 0.3, 1)
+        )
+
+        start_btn = self._create_control_button(
+            "START", self._confirm_modal.dismiss, (0.3, 0.8, 0.3, 1)
+        )
+        start_btn.bind(on_press=lambda *x: self.start_process())
 
-        layout.add_widget(close_btn)
-        modal.add_widget(layout)
-        modal.open()
+        btn_layout.add_widget(cancel_btn)
+        btn_layout.add_widget(start_btn)
+
+        layout.add_widget(btn_layout)
+        self._confirm_modal.add_widget(layout)
+
+    def show_modal(self, title, message, is_error=False, callback=None, force=False):
+        """
+        Displays a custom modal message instead of alert().
+
+        An open confirmation (e.g. ABORT) is kept unless `force` is set, which
+        replaces it and drops its callback (used once the run has ended anyway).
+        """
+        if self._message_modal.parent and self._message_callback and not force:
+            return  # Never clobber an open confirmation with a plain message
+
+        color = (0.8, 0.2, 0.2, 1) if is_error else (0.2, 0.8, 0.2, 1)
+
+        # Reuse the prebuilt modal; only its text, colors and callback change
+        self._message_title_label.text = title
+        self._message_title_label.color = color
+        self._message_body_label.text = message
+        self._message_ok_btn.background_color = color
+        self._message_callback = callback
+        if not self._message_modal.parent:
+            self._message_modal.open()
+
+    def _on_message_ok(self, instance):
+        """Dismisses the message modal, then runs its pending callback (if any)."""
+        self._message_modal.dismiss()
+        callback, self._message_callback = self._message_callback, None
+        if callback:
+            callback(instance)
+
+    def _set_text(self, label, text):
+        """Assigns label text only when it changed, skipping a texture rebuild."""
+        if label.text != text:
+            label.text = text
+
+    def _queue_update(self, widget, value, prop="text"):
+        """Queues a widget property write for the next batched flush."""
+        self._pending[(widget, prop)] = value
+        self._flush_trigger()
+
+    def _flush_pending(self, dt):
+        """Applies all queued widget writes in one pass, skipping unchanged ones."""
+        pending, self._pending = self._pending, {}
+        for (widget, prop), value in pending.items():
+            if getattr(widget, prop) != value:
+                setattr(widget, prop, value)
+
+    def _discard_pending(self):
+        """Drops queued readout writes so they cannot overwrite a newer state."""
+        self._flush_trigger.cancel()
+        self._pending = {}
 
     # --- Input Handlers (No Changes) ---
 
@@ -370,6 +485,8 @@ class ElectroplatingControllerApp(App):
             val = float(instance.text)
             if val <= 0:
                 raise ValueError
+            if val == self.target_thickness_um:
+                return  # Unchanged (e.g. re-validated on unfocus); skip recalculation
             self.target_thickness_um = val
             self.update_calculations()
         except ValueError:
@@ -386,6 +503,8 @@ class ElectroplatingControllerApp(App):
             val = float(instance.text)
             if val <= 0:
                 raise ValueError
+            if val == self.target_area_cm2:
+                return  # Unchanged (e.g. re-validated on unfocus); skip recalculation
             self.target_area_cm2 = val
             self.update_calculations()
         except ValueError:
@@ -398,15 +517,11 @@ class ElectroplatingControllerApp(App):
 
     def on_complexity_change(self, instance, value):
         """Handles complexity slider change."""
+        if int(value) == self.complexity:
+            return
         self.complexity = int(value)
-        complexity_map = {
-            1: "Basic",
-            2: "Simple",
-            3: "Moderate",
-            4: "Complex",
-            5: "Highly Detailed",
-        }
-        self.complexity_label.text = f"Complexity: {self.complexity} ({complexity_map.get(self.complexity, 'Basic')})"
+        name = PlatingCalculator.COMPLEXITY_TABLE[self.complexity - 1][2]
+        self.complexity_label.text = f"Complexity: {self.complexity} ({name})"
         self.update_calculations()
 
     def update_calculations(self, *args):
@@ -419,9 +534,9 @@ class ElectroplatingControllerApp(App):
         self.target_voltage_V = metrics["target_voltage_V"]
         self.estimated_time_sec = metrics["estimated_time_sec"]
 
-        self.target_current_label.text = f"{self.target_current_A:.3f} A"
-        self.target_voltage_label.text = f"{self.target_voltage_V:.2f} V"
-        self.estimated_time_label.text = format_time(self.estimated_time_sec)
+        self._set_text(self.target_current_label, _CURR_FMT % self.target_current_A)
+        self._set_text(self.target_voltage_label, _VOLT_FMT % self.target_voltage_V)
+        self._set_text(self.estimated_time_label, format_time(self.estimated_time_sec))
 
         # Enable start button if connected and calculated values are valid
         self.start_btn.disabled = (
@@ -477,18 +592,24 @@ class ElectroplatingControllerApp(App):
             )
             return
 
-        # 1. Apply Settings
-        apply_command = f"APPLY {self.target_voltage_V} {self.target_current_A}"
-        if not self.psu_interface.send_command(apply_command):
-            self.status_message = "ERROR: Failed to set parameters."
-            self.status_label.text = self.status_message
-            return
+        # 1. Apply Settings and Turn Output ON in one compound SCPI message
+        # (waits until it is written, so a failed write is reported here)
+        output_on = self.psu_interface.send_command(
+            f"APPLY {self.target_voltage_V} {self.target_current_A};OUTP ON"
+        )
 
-        # 2. Turn Output ON
-        if self.psu_interface.send_command("OUTP ON"):
+        # 2. Start Monitoring
+        if output_on:
             self.is_plating_active = True
             self.time_elapsed_sec = 0
             self.progress_percent = 0
+            # Hoist the divide out of the 1 Hz loop (estimated time is fixed here)
+            self._pct_per_sec = 100.0 / self.estimated_time_sec
+
+            # Start background polling, discarding any sample left from a pause
+            self._drain_psu_queue()
+            self._psu_sample = (0.0, 0.0, "PLATING ACTIVE")
+            self._psu_run.set()
 
             # Start the live monitoring loop
             if self.live_update_event:
@@ -506,52 +627,22 @@ class ElectroplatingControllerApp(App):
 
         else:
             self.status_message = "ERROR: Failed to turn output ON."
+            if not self.psu_interface.is_connected:
+                # The failed write closed the session; offer CONNECT again
+                self.connect_btn.text = "CONNECT"
+                self.connect_btn.background_color = (0.2, 0.6, 0.2, 1)
+                self.start_btn.disabled = True
 
         self.status_label.text = self.status_message
 
     def on_start_plating(self, instance):
         """Shows a confirmation dialog before starting."""
-        modal = ModalView(
-            size_hint=(0.85, 0.5),
-            auto_dismiss=False,
-            background_color=(0.1, 0.1, 0.2, 0.9),
-        )
-        layout = BoxLayout(orientation="vertical", padding=dp(10), spacing=dp(10))
-
-        message = (
+        self._confirm_body_label.text = (
             f"Confirm Plating Start/Resume?\n\n"
             f"V: **{self.target_voltage_V:.2f} V**, A: **{self.target_current_A:.3f} A**\n"
             f"Est. Time Remaining: **{format_time(self.estimated_time_sec - self.time_elapsed_sec)}**"
         )
-
-        layout.add_widget(
-            Label(
-                text="START CONFIRMATION",
-                font_size="16dp",
-                color=(0.7, 0.9, 0.7, 1),
-                size_hint_y=0.2,
-            )
-        )
-        layout.add_widget(
-            Label(text=message, font_size="11dp", color=(1, 1, 1, 1), size_hint_y=0.5)
-        )
-
-        btn_layout = BoxLayout(spacing=dp(10), size_hint_y=0.3)
-        cancel_btn = self._create_control_button(
-            "CANCEL", modal.dismiss, (0.8, 0.3, 0.3, 1)
-        )
-
-        start_btn = self._create_control_button(
-            "START", modal.dismiss, (0.3, 0.8, 0.3, 1)
-        )
-        start_btn.bind(on_press=lambda *x: self.start_process())
-
-        btn_layout.add_widget(cancel_btn)
-        btn_layout.add_widget(start_btn)
-
-        layout.add_widget(btn_layout)
-        modal.add_widget(layout)
-        modal.open()
+        self._confirm_modal.open()
 
     def on_pause_plating(self, instance):
         """Pauses the plating process."""
@@ -562,6 +653,8 @@ class ElectroplatingControllerApp(App):
             if self.live_update_event:
                 self.live_update_event.cancel()
                 self.live_update_event = None
+            self._psu_run.clear()
+            self._discard_pending()
 
             self.status_message = (
                 f"PAUSED (Elapsed: {format_time(self.time_elapsed_sec)})"
@@ -587,11 +680,14 @@ class ElectroplatingControllerApp(App):
         if self.live_update_event:
             self.live_update_event.cancel()
             self.live_update_event = None
+        self._psu_run.clear()
+        self._discard_pending()
 
         self.psu_interface.send_command("OUTP OFF")
         self.is_plating_active = False
         self.time_elapsed_sec = 0
         self.progress_percent = 0
+        self._pct_per_sec = 0.0
         self.start_btn.text = "START PLATING"
 
         self.status_message = "ABORTED. Resetting."
@@ -606,9 +702,9 @@ class ElectroplatingControllerApp(App):
         # Clear live readouts and progress
         self.current_readout_V = 0.0
         self.current_readout_A = 0.0
-        self.actual_voltage_label.text = f"{self.current_readout_V:.2f} V"
-        self.actual_current_label.text = f"{self.current_readout_A:.3f} A"
-        self.time_elapsed_label.text = format_time(self.time_elapsed_sec)
+        self._set_text(self.actual_voltage_label, _VOLT_FMT % self.current_readout_V)
+        self._set_text(self.actual_current_label, _CURR_FMT % self.current_readout_A)
+        self._set_text(self.time_elapsed_label, format_time(self.time_elapsed_sec))
         self.progress_bar.value = 0
         self.status_label.text = "ABORTED. Resetting."  # Reset status text
 
@@ -619,28 +715,30 @@ class ElectroplatingControllerApp(App):
         if not self.is_plating_active:
             return
 
-        # 1. Read Actual Data
-        V, A, status = self.psu_interface.read_data()
+        # 1. Read Actual Data (latest sample from the poller, never blocking)
+        try:
+            self._psu_sample = self._psu_q.get_nowait()
+        except queue.Empty:
+            pass  # No fresh sample yet; keep showing the previous one
+        V, A, status = self._psu_sample
         self.current_readout_V = V
         self.current_readout_A = A
 
-        # 2. Update UI Readouts
-        self.actual_voltage_label.text = f"{V:.2f} V"
-        self.actual_current_label.text = f"{A:.3f} A"
+        # 2. Update UI Readouts (batched into a single flush on the next frame)
+        self._queue_update(self.actual_voltage_label, _VOLT_FMT % V)
+        self._queue_update(self.actual_current_label, _CURR_FMT % A)
 
         # 3. Update Time and Progress
         self.time_elapsed_sec += 1
-        self.time_elapsed_label.text = format_time(self.time_elapsed_sec)
+        self._queue_update(self.time_elapsed_label, format_time(self.time_elapsed_sec))
 
-        if self.estimated_time_sec > 0:
-            self.progress_percent = min(
-                100, int((self.time_elapsed_sec / self.estimated_time_sec) * 100)
-            )
-        else:
-            self.progress_percent = 0
+        percent = int(self.time_elapsed_sec * self._pct_per_sec)
+        self.progress_percent = 100 if percent > 100 else percent
 
-        self.progress_bar.value = self.progress_percent
-        self.status_label.text = f"{status} ({self.progress_percent}%)"
+        self._queue_update(self.progress_bar, self.progress_percent, prop="value")
+        self._queue_update(
+            self.status_label, _STATUS_FMT % (status, self.progress_percent)
+        )
 
         # 4. Check for Alerts/Completion
         if "ALERT" in status:
@@ -655,15 +753,19 @@ class ElectroplatingControllerApp(App):
             if self.live_update_event:
                 self.live_update_event.cancel()
                 self.live_update_event = None
+            self._psu_run.clear()
 
             self.psu_interface.send_command("OUTP OFF")
             self.is_plating_active = False
+            self._pct_per_sec = 0.0
             self.status_message = "PLATING COMPLETE"
 
-            # Final progress update
-            self.progress_bar.value = 100
-            self.status_label.text = self.status_message
-            self.time_elapsed_label.text = format_time(self.estimated_time_sec)
+            # Final progress update (queued so it supersedes this tick's readouts)
+            self._queue_update(self.progress_bar, 100, prop="value")
+            self._queue_update(self.status_label, self.status_message)
+            self._queue_update(
+                self.time_elapsed_label, format_time(self.estimated_time_sec)
+            )
 
             self.start_btn.disabled = True
             self.pause_btn.disabled = True
@@ -673,10 +775,32 @@ class ElectroplatingControllerApp(App):
                 "Process Complete",
                 "Desired plating thickness achieved. Output turned OFF. Check part.",
                 is_error=False,
+                force=True,  # Replaces a pending ABORT confirmation: nothing to abort
             )
 
+    def _psu_poll_loop(self):
+        """Background thread: polls the PSU while plating is active."""
+        while True:
+            self._psu_run.wait()
+            sample = self.psu_interface.read_data()
+            # Replace any unread sample so the UI only ever sees the latest one
+            self._drain_psu_queue()
+            self._psu_q.put_nowait(sample)
+            time.sleep(PSU_POLL_INTERVAL_SEC)
+
+    def _drain_psu_queue(self):
+        """Discards any unread PSU sample."""
+        try:
+            self._psu_q.get_nowait()
+        except queue.Empty:
+            pass
+
 
 if __name__ == "__main__":
+    # Route PSU interface logs to the console as before; set DEBUG to also see
+    # every command sent
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     try:
         # Set default Kivy configurations for embedded use
         from kivy.config import Config
@@ -4,23 +4,204 @@ The configuration is based on the user's provided PyVISA script, assuming a seri
 connection over a USB-to-Serial adapter.
 """
 
+import asyncio
+from array import array
+import concurrent.futures
+import functools
+import logging
+import os
+import queue
+import re
+import threading
 import pyvisa
 import time
 
+log = logging.getLogger(__name__)
+
 # --- CONFIGURATION (Based on user's PyVISA script) ---
 # IMPORTANT: This must match your device's VISA resource string.
 PSU_ADDRESS = "ASRL/dev/ttyUSB0::INSTR"
+# Regex the *IDN? reply must match (e.g. r"RIGOL.*DP8") before any port other
+# than PSU_ADDRESS is used. None disables the serial port scan entirely, so
+# only PSU_ADDRESS is ever opened.
+PSU_IDN_PATTERN = None
 BAUD_RATE = 115200
 TIMEOUT_MS = 5000  # 5 seconds
+TERMINATION = "\n"
+READ_CHUNK_SIZE = 4096  # Bytes per backend read; fits any response in one call
+SAMPLE_BUFFER_SIZE = 4096  # Readings kept in the ring buffer (~68 min at 1 Hz)
+PROBE_TIMEOUT_MS = 500  # Short timeout for capability probes at connect time
+QUERY_CACHE_SIZE = 32  # Max distinct commands held by cached_query()
+IDN_CACHE_TTL_SEC = 3600.0  # Identity never changes within a session
+# USB-serial adapters buffer short packets for latency_timer ms (default 16)
+USB_LATENCY_TIMER_MS = 1
+# Last scanned address whose *IDN? matched PSU_IDN_PATTERN
+ADDRESS_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "scpi_addr")
+
+# APPLY values closer than this to the last ones sent are not re-sent
+# (half the resolution of the %.2f V / %.3f A setpoint writes)
+APPLY_V_TOLERANCE = 0.005
+APPLY_A_TOLERANCE = 0.0005
+
+# Setpoint message templates: native APPLy, or separate voltage/current limit
+_APPLY_FMT = b"APPLy %.2f,%.3f"
+_VOLT_CURR_FMT = b"VOLTage %.2f;:CURRent %.3f"
+
+# Command format: APPLY V A or APPLY V,A (e.g., APPLY 5.0 0.5)
+_APPLY_RE = re.compile(r"APPLY\s+([^\s,]+)\s*[\s,]\s*([^\s,]+)")
+
+# Output commands -> (encoded SCPI message, log message, resulting output state)
+_OUTPUT_COMMANDS = {
+    "OUTP ON": (b"OUTPut:STATe ON", "SCPI: Output ON.", True),
+    "OUTP OFF": (b"OUTPut:STATe OFF", "SCPI: Output OFF.", False),
+}
+_TERMINATION_BYTES = TERMINATION.encode("ascii")
+
+# IEEE 488.2 status byte: Error/Event Available (error queue not empty)
+STB_ERROR_AVAILABLE = 0x04
+
+
+def _set_usb_latency_timer(address, latency_ms=USB_LATENCY_TIMER_MS):
+    """
+    Lowers the Linux USB-serial latency_timer for the adapter behind `address`.
+
+    Best effort: needs write access to sysfs (root or a udev rule) and only
+    applies to ASRL resources on USB-serial devices such as /dev/ttyUSB0.
+    """
+    match = re.match(r"ASRL/dev/(tty\w+)::", address)
+    if not match:
+        return False
+
+    path = f"/sys/bus/usb-serial/devices/{match.group(1)}/latency_timer"
+    try:
+        with open(path, "w") as f:
+            f.write(str(latency_ms))
+    except PermissionError:
+        log.warning(
+            "SCPI Warning: No permission to write %s; "
+            "run as root or set it via a udev rule for faster SCPI I/O.",
+            path,
+        )
+        return False
+    except OSError:
+        return False  # Not a USB-serial adapter (or not Linux)
+
+    log.info("SCPI: USB latency_timer set to %d ms.", latency_ms)
+    return True
+
+
+def _device_present(address):
+    """
+    Cheap existence check for the device node behind an ASRL resource string.
+
+    Non-serial resources cannot be checked without the backend, so they are
+    assumed present and left to open_resource() to reject.
+    """
+    match = re.match(r"ASRL(/dev/[^:]+)::", address)
+    return os.path.exists(match.group(1)) if match else True
+
+
+def _load_cached_address():
+    """Returns the address saved by the last successful port scan, if any."""
+    try:
+        with open(ADDRESS_CACHE_FILE) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _save_cached_address(address):
+    """Remembers a working address for the next start (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(ADDRESS_CACHE_FILE), exist_ok=True)
+        with open(ADDRESS_CACHE_FILE, "w") as f:
+            f.write(address)
+    except OSError as e:
+        log.debug("SCPI: Could not cache address in %s: %s", ADDRESS_CACHE_FILE, e)
+
+
+def _drop_cached_address():
+    """Forgets a cached address that no longer reaches the PSU (best effort)."""
+    try:
+        os.remove(ADDRESS_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _enable_low_latency_mode(resource):
+    """
+    Sets ASYNC_LOW_LATENCY on the pyserial port behind a pyvisa-py resource.
+
+    Complements the latency_timer tweak through a portable ioctl. Best effort:
+    other backends (e.g. NI-VISA) do not expose the underlying serial handle.
+    """
+    try:
+        session = resource.visalib.sessions[resource.session]
+        session.interface.set_low_latency_mode(True)
+    except (AttributeError, KeyError, TypeError, ValueError, OSError):
+        return False
+
+    log.info("SCPI: Serial low-latency mode enabled.")
+    return True
+
+
+def _synchronized(method):
+    """Serializes calls on the instance I/O lock (VISA sessions are not thread-safe)."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._io_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class PowerSupplyInterface:
+    # Shared across instances and reconnects: creating a ResourceManager scans
+    # the VISA backends, so it is built once and never closed on disconnect
+    _rm_singleton = None
+
     def __init__(self):
         self.is_connected = False
         self.output_on = False
         self.psu = None
         self.rm = None
+        # Whether the PSU accepts the native "APPLy V,A" command (probed on connect)
+        self._supports_apply = False
+        # Setpoint template matching _supports_apply, chosen once on connect
+        self._setpoint_fmt = _VOLT_CURR_FMT
+        # Whether chained measurement queries work: None until the first read
+        self._compound_ok = None
+        # Last voltage/current setpoints sent, to skip redundant APPLY writes
+        self._last_v = None
+        self._last_a = None
+        # cached_query() results: command -> (time.monotonic() when read, reply)
+        self._qcache = {}
+
+        # Ring buffer of recent readings, one contiguous typed array per field
+        # (structure of arrays). Fixed size, so long runs allocate nothing; the
+        # arrays support the buffer protocol (e.g. numpy.frombuffer) for analytics.
+        self.buf_v = array("f", [0.0]) * SAMPLE_BUFFER_SIZE
+        self.buf_a = array("f", [0.0]) * SAMPLE_BUFFER_SIZE
+        self.buf_t = array("d", [0.0]) * SAMPLE_BUFFER_SIZE  # time.monotonic()
+        self._idx = 0  # Total samples written; next slot is _idx % size
+
+        # Re-entrant: read_data() closes the session on a comms failure
+        self._io_lock = threading.RLock()
+        # Guards output_on/_last_v/_last_a and the queue order; never held for I/O
+        self._state_lock = threading.Lock()
+
+        # Fire-and-forget SCPI writes are sent in order by a background thread,
+        # so callers never block on the serial link; queries stay synchronous
+        self._tx_q = queue.Queue()
+        self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self._tx_thread.start()
+
+        # Single worker for the asyncio facade: keeps VISA calls off the event
+        # loop while never running two of them concurrently
+        self._loop_exec = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
+    @_synchronized
     def connect(self):
         """Attempts to establish a PyVISA connection to the instrument."""
         if self.is_connected:
@@ -28,95 +209,285 @@ class PowerSupplyInterface:
 
         try:
             # Specify the pyvisa-py backend for maximum compatibility
-            self.rm = pyvisa.ResourceManager("@py")
-            self.psu = self.rm.open_resource(PSU_ADDRESS)
+            if PowerSupplyInterface._rm_singleton is None:
+                PowerSupplyInterface._rm_singleton = pyvisa.ResourceManager("@py")
+            self.rm = PowerSupplyInterface._rm_singleton
+            # Opens the first candidate that answers *IDN? (the liveness check,
+            # always sent); the reply then seeds cached_query("*IDN?")
+            self.psu, idn = self._open_psu()
+            self._qcache["*IDN?"] = (time.monotonic(), idn)
+            log.info("SCPI: Connected to: %s", idn)
 
-            # Configure serial connection parameters based on user's script
-            self.psu.baud_rate = BAUD_RATE
-            self.psu.read_termination = "\n"
-            self.psu.write_termination = "\n"
-            self.psu.timeout = TIMEOUT_MS
-
-            # Test connection with a common SCPI command
-            idn = self.psu.query("*IDN?").strip()
-            print(f"SCPI: Connected to: {idn}")
+            self._supports_apply = self._probe_apply()
+            self._setpoint_fmt = _APPLY_FMT if self._supports_apply else _VOLT_CURR_FMT
+            self._compound_ok = None
+            # Discard any errors raised by unsupported probe commands
+            self.psu.write("*CLS")
 
             self.is_connected = True
             return True
 
         except pyvisa.errors.VisaIOError as e:
-            print(f"SCPI Error: Connection failed. Details: {e}")
-            self.is_connected = False
-            self.psu = None
-            self.rm = None
+            log.error("SCPI Error: Connection failed. Details: %s", e)
+            self._abort_connect()
             return False
         except Exception as e:
-            print(f"SCPI Error: Unexpected error during connection: {e}")
-            self.is_connected = False
+            log.error("SCPI Error: Unexpected error during connection: %s", e)
+            self._abort_connect()
             return False
 
+    def _abort_connect(self):
+        """Releases a half-opened session after a failed connect()."""
+        if self.psu:
+            try:
+                self.psu.close()
+            except pyvisa.errors.VisaIOError:
+                pass  # Already unusable; nothing left to release
+        self.is_connected = False
+        self._qcache.clear()
+        self.psu = None
+        self.rm = None
+
+    def _open_psu(self):
+        """
+        Opens the PSU, returning (resource, *IDN? reply).
+
+        PSU_ADDRESS is opened directly when its device node exists. Only if it
+        fails, and PSU_IDN_PATTERN is set, are the cached address and then the
+        USB-serial ports from list_resources() tried; those are only accepted
+        when their *IDN? reply matches the pattern, so other serial devices on
+        the bench (e.g. a printer) are never driven. Rejected ports are closed.
+        """
+        last_error = pyvisa.errors.VisaIOError(
+            pyvisa.constants.StatusCode.error_resource_not_found
+        )
+        if _device_present(PSU_ADDRESS):
+            try:
+                return self._open_verified(PSU_ADDRESS)
+            except pyvisa.errors.VisaIOError as e:
+                last_error = e
+        if PSU_IDN_PATTERN is None:
+            raise last_error
+
+        cached = _load_cached_address()
+        if cached and cached != PSU_ADDRESS and _device_present(cached):
+            try:
+                return self._open_verified(cached, PSU_IDN_PATTERN)
+            except pyvisa.errors.VisaIOError as e:
+                last_error = e
+                _drop_cached_address()
+
+        log.info("SCPI: %s not available; scanning serial ports.", PSU_ADDRESS)
+        for address in self.rm.list_resources("ASRL?*::INSTR"):
+            # Only USB-serial adapters; on-board ttyS ports always open
+            if address in (PSU_ADDRESS, cached) or not re.search(
+                r"tty(USB|ACM)", address
+            ):
+                continue
+            try:
+                opened = self._open_verified(address, PSU_IDN_PATTERN)
+            except pyvisa.errors.VisaIOError as e:
+                last_error = e
+                continue
+            _save_cached_address(address)
+            return opened
+
+        raise last_error
+
+    def _open_verified(self, address, idn_pattern=None):
+        """
+        Opens and configures `address`; closes it again unless *IDN? answers
+        (and matches `idn_pattern`, when given).
+        """
+        psu = self.rm.open_resource(address)
+        try:
+            # Configure serial connection parameters based on user's script
+            psu.baud_rate = BAUD_RATE
+            psu.read_termination = TERMINATION
+            psu.write_termination = TERMINATION
+            psu.timeout = TIMEOUT_MS
+            psu.chunk_size = READ_CHUNK_SIZE
+
+            # Test connection with a common SCPI command
+            idn = psu.query("*IDN?").strip()
+            if not idn or (idn_pattern and not re.search(idn_pattern, idn)):
+                log.info("SCPI: Ignoring %s (*IDN? reply %r).", address, idn)
+                raise pyvisa.errors.VisaIOError(
+                    pyvisa.constants.StatusCode.error_resource_not_found
+                )
+        except Exception:
+            psu.close()
+            raise
+
+        # Latency tweaks only for the port actually used as the PSU
+        _set_usb_latency_timer(address)
+        _enable_low_latency_mode(psu)
+        return psu, idn
+
+    def _probe_apply(self):
+        """Checks once whether the PSU understands the single-message APPLy command."""
+        try:
+            self.psu.timeout = PROBE_TIMEOUT_MS
+            self.psu.write("*CLS")  # Clear stale errors so only the probe's show up
+            # The query form reads back the setpoints without changing them
+            self.psu.query("APPLy?")
+            supported = "No error" in self.psu.query("SYSTem:ERRor?")
+        except pyvisa.errors.VisaIOError:
+            supported = False
+        finally:
+            self.psu.timeout = TIMEOUT_MS
+
+        log.info(
+            "SCPI: APPLy command %s.", "supported" if supported else "not supported"
+        )
+        return supported
+
     def disconnect(self):
         """Closes the connection safely."""
+        # Let queued writes land first; must not hold the I/O lock while waiting
+        self.flush()
+        self._close()
+
+    @_synchronized
+    def _close(self):
+        """Turns the output off and closes the VISA session."""
         if self.psu:
             try:
-                # Ensure output is OFF before disconnecting
-                self.psu.write("OUTP OFF")
+                # Output OFF, clear status and return to local panel in one frame
+                self.psu.write("OUTP OFF;*CLS;SYST:LOC")
                 self.psu.close()
-            except pyvisa.errors.VisaIOError as e:
-                print(f"SCPI Warning: Could not close safely: {e}")
+            except Exception as e:
+                # The state below must be reset whatever the link failure was
+                log.warning("SCPI Warning: Could not close safely: %s", e)
             self.psu = None
 
         self.is_connected = False
-        self.output_on = False
-        print("SCPI: Disconnected.")
+        with self._state_lock:
+            self.output_on = False
+            # The PSU state is unknown after a close, so always re-send setpoints
+            self._last_v = None
+            self._last_a = None
+        self._qcache.clear()  # A reconnect may reach a different instrument
+        log.info("SCPI: Disconnected.")
 
     def send_command(self, command):
-        """Sends an SCPI command (APPLY V A, OUTP ON/OFF)."""
-        if not self.is_connected or not self.psu:
-            print(f"SCPI Error: Cannot send command '{command}'. Not connected.")
-            return False
+        """
+        Sends an SCPI command (APPLY V A, OUTP ON/OFF).
 
-        command = command.strip().upper()
+        Several commands may be joined with ';' (e.g. "APPLY 5.0 0.5;OUTP ON");
+        they are translated and sent as one compound SCPI message, saving a
+        serial round-trip per extra command.
 
-        if command.startswith("APPLY"):
-            # Command format: APPLY V A (e.g., APPLY 5.0 0.5)
-            try:
-                parts = command.split()
-                if len(parts) == 3:
-                    V = float(parts[1])
-                    A = float(parts[2])
-                    # Send voltage and current limit commands sequentially
-                    self.psu.write(f"VOLTage {V:.2f}")
-                    self.psu.write(f"CURRent {A:.3f}")
-                    print(f"SCPI: Set V={V:.2f}, A={A:.3f}")
-                    return True
-            except (ValueError, pyvisa.errors.VisaIOError) as e:
-                print(f"SCPI Error: Failed to set APPLY parameters: {e}")
-                return False
-
-        elif command == "OUTP ON":
-            try:
-                self.psu.write("OUTPut:STATe ON")
-                self.output_on = True
-                print("SCPI: Output ON.")
-                return True
-            except pyvisa.errors.VisaIOError as e:
-                print(f"SCPI Error: Failed to turn output ON: {e}")
-                return False
+        Setpoint-only writes are queued for the background writer, so True
+        means the command was valid and queued; a failed write disconnects (see
+        read_data). A message that switches the output waits until it is sent
+        and returns False if the write failed.
+        """
+        ok, output_changed = self._queue_command(command)
+        if ok and output_changed:
+            # Must wait outside the I/O lock, which the writer needs
+            self.flush()
+            return self.is_connected
+        return ok
 
-        elif command == "OUTP OFF":
-            try:
-                self.psu.write("OUTPut:STATe OFF")
-                self.output_on = False
-                print("SCPI: Output OFF.")
-                return True
-            except pyvisa.errors.VisaIOError as e:
-                print(f"SCPI Error: Failed to turn output OFF: {e}")
-                return False
+    def _queue_command(self, command):
+        """Translates and queues `command`; returns (valid, output state changed)."""
+        # Only the short state lock: queueing must not wait for a query that
+        # holds the I/O lock (this is usually called from the UI thread)
+        with self._state_lock:
+            if not self.is_connected or not self.psu:
+                log.error(
+                    "SCPI Error: Cannot send command '%s'. Not connected.", command
+                )
+                return False, False
 
-        print(f"SCPI Warning: Unhandled command '{command}'")
-        return False
+            scpi_parts = []
+            messages = []  # (format, args) pairs, logged once the write is queued
+            output_state = None
+            setpoints = None
+
+            for part in command.upper().split(";"):
+                part = part.strip().lstrip(":")
+
+                apply_match = _APPLY_RE.fullmatch(part)
+                if apply_match:
+                    try:
+                        V = float(apply_match.group(1))
+                        A = float(apply_match.group(2))
+                    except ValueError as e:
+                        log.error("SCPI Error: Failed to set APPLY parameters: %s", e)
+                        return False, False
+                    if (
+                        self._last_v is not None
+                        and abs(V - self._last_v) < APPLY_V_TOLERANCE
+                        and abs(A - self._last_a) < APPLY_A_TOLERANCE
+                    ):
+                        continue  # PSU already holds these setpoints
+                    setpoints = (V, A)
+                    scpi_parts.append(self._setpoint_fmt % setpoints)
+                    messages.append(("SCPI: Set V=%.2f, A=%.3f", (V, A)))
+
+                elif part in _OUTPUT_COMMANDS:
+                    scpi, message, state = _OUTPUT_COMMANDS[part]
+                    current = self.output_on if output_state is None else output_state
+                    if state == current:
+                        continue  # Output already in the requested state
+                    output_state = state
+                    scpi_parts.append(scpi)
+                    messages.append((message, ()))
 
+                else:
+                    log.warning("SCPI Warning: Unhandled command '%s'", part)
+                    return False, False
+
+            if not scpi_parts:
+                return True, False  # Nothing changed, nothing to send
+
+            # ';:' resets the SCPI header path between compound commands. Parts are
+            # built as bytes so the writer can send them with write_raw as-is.
+            self._tx_q.put(b";:".join(scpi_parts) + _TERMINATION_BYTES)
+
+            if output_state is not None:
+                self.output_on = output_state
+            if setpoints is not None:
+                self._last_v, self._last_a = setpoints
+            for message, args in messages:
+                log.debug(message, *args)
+            return True, output_state is not None
+
+    def identity(self):
+        """Returns the *IDN? string of the connected PSU (cached), or None."""
+        return self.cached_query("*IDN?", IDN_CACHE_TTL_SEC)
+
+    @_synchronized
+    def cached_query(self, command, ttl):
+        """
+        Queries `command`, reusing the reply for `ttl` seconds.
+
+        connect() seeds "*IDN?", so identity() is served without I/O.
+
+        Only for idempotent queries of values that rarely change (*IDN?,
+        SYSTem:VERSion?, static configuration) -- never SYSTem:ERRor?, which
+        pops the error queue. Returns None when not connected; a link failure
+        disconnects and returns None (see _do).
+        """
+        if not self.is_connected:
+            return None
+        now = time.monotonic()
+        cached = self._qcache.get(command)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        reply = self._do(self.psu.query, command)
+        if reply is None:
+            return None
+        reply = reply.strip()
+        if command not in self._qcache and len(self._qcache) >= QUERY_CACHE_SIZE:
+            del self._qcache[next(iter(self._qcache))]  # Evict the oldest entry
+        self._qcache[command] = (now, reply)
+        return reply
+
+    @_synchronized
     def read_data(self):
         """
         Reads the actual voltage and current from the instrument.
@@ -134,28 +505,176 @@ class PowerSupplyInterface:
             return 0.0, 0.0, "OUTPUT OFF (Connected)"
 
         try:
-            # Query the actual measured values
-            V = float(self.psu.query("MEASure:VOLTage?").strip())
-            A = float(self.psu.query("MEASure:CURRent?").strip())
+            reading = self._do(self._query_measurements)
+        except ValueError:
+            # Handle case where measurement returns non-numeric string
+            return V, A, "MEASUREMENT READ FAIL"
 
-            # Query system error register (optional, helps check device health)
-            try:
-                error_state = self.psu.query("SYSTem:ERRor?").strip()
-                if "No error" not in error_state:
-                    status = f"ALERT: PSU Error ({error_state})"
-            except pyvisa.errors.VisaIOError:
-                # Ignore if SYSTem:ERRor is not supported
-                pass
+        if reading is None:
+            # Communication failure mid-operation; _do() has disconnected
+            return V, A, "COMMS ERROR - PSU OFFLINE"
+
+        V, A, error_state = reading
+        self._record_sample(V, A)
+        if error_state is not None and "No error" not in error_state:
+            status = f"ALERT: PSU Error ({error_state})"
+
+        return V, A, status
 
+    def _do(self, fn, *args):
+        """
+        Runs one PSU I/O step, returning its result or None once disconnected.
+
+        The first VisaIOError logs, closes the session and returns None; later
+        calls then short-circuit on is_connected without touching the link.
+        Other exceptions (e.g. ValueError from parsing) propagate.
+        """
+        if not self.is_connected:
+            return None
+        try:
+            return fn(*args)
         except pyvisa.errors.VisaIOError as e:
-            # Handle communication failure mid-operation
-            print(f"SCPI Read Error: {e}")
-            status = "COMMS ERROR - PSU OFFLINE"
-            # Attempt a full disconnect on comms failure
-            self.disconnect()
+            log.error("SCPI Error: %s failed: %s", fn.__name__, e)
+            self._close()
+            return None
 
-        except ValueError:
-            # Handle case where measurement returns non-numeric string
-            status = "MEASUREMENT READ FAIL"
+    def _record_sample(self, V, A):
+        """Stores a reading in the ring buffer in place."""
+        i = self._idx % SAMPLE_BUFFER_SIZE
+        self.buf_v[i] = V
+        self.buf_a[i] = A
+        self.buf_t[i] = time.monotonic()
+        self._idx += 1
 
-        return V, A, status
+    @_synchronized
+    def latest_window(self, n):
+        """
+        Returns the last n buffered readings in chronological order.
+
+        Returns: (times, voltages, currents) as array copies
+        """
+        n = min(n, self._idx, SAMPLE_BUFFER_SIZE)
+        end = self._idx % SAMPLE_BUFFER_SIZE
+        start = end - n
+        if start >= 0:
+            return tuple(buf[start:end] for buf in (self.buf_t, self.buf_v, self.buf_a))
+        # Window wraps around the end of the ring
+        return tuple(
+            buf[start:] + buf[:end] for buf in (self.buf_t, self.buf_v, self.buf_a)
+        )
+
+    async def send_command_async(self, command):
+        """Awaitable send_command(); runs on the interface's I/O worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._loop_exec, self.send_command, command
+        )
+
+    async def read_data_async(self):
+        """Awaitable read_data(); runs on the interface's I/O worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._loop_exec, self.read_data
+        )
+
+    def flush(self):
+        """Blocks until every queued SCPI write has been sent."""
+        self._tx_q.join()
+
+    def _tx_loop(self):
+        """Background writer: sends queued SCPI writes to the PSU in order."""
+        while True:
+            message = self._tx_q.get()
+            try:
+                with self._io_lock:
+                    # Nobody waits on this write, so a failure just disconnects
+                    if self.is_connected:
+                        self._do(self.psu.write_raw, message)
+            except Exception as e:
+                # Non-VISA failures (e.g. SerialException on USB unplug) must not
+                # kill this thread, or flush() would block forever
+                log.error("SCPI Error: Failed to send %r: %s", message, e)
+                self._close()
+            finally:
+                self._tx_q.task_done()
+
+    def _query_measurements(self):
+        """
+        Queries measured voltage, current and the system error register.
+
+        Uses one compound query (one serial round-trip instead of three) that
+        reads the 1-byte status register instead of SYSTem:ERRor?, which is only
+        queried when the Error/Event Available bit says the queue is non-empty.
+        Falls back to separate queries for PSUs that cannot chain them.
+
+        Returns: (Voltage, Current, Error_State or None if none/unsupported)
+        """
+        if self._compound_ok is not False:
+            try:
+                self.psu.write("MEASure:VOLTage?;:MEASure:CURRent?;*STB?")
+                # Parse the raw reply once; float()/int() accept bytes directly,
+                # so there is no decode or per-field strip
+                v_raw, a_raw, stb_raw = self._read_reply().split(b";")
+                V, A, stb = float(v_raw), float(a_raw), int(stb_raw)
+                self._compound_ok = True
+            except (ValueError, pyvisa.errors.VisaIOError):
+                if self._compound_ok:
+                    raise  # Chaining is known to work: a genuine read failure
+                self._compound_ok = False
+                log.info("SCPI: Compound queries unsupported; using separate queries.")
+                self._discard_input()
+                # Drop the error the rejected query left queued (not a real alert)
+                self.psu.write("*CLS")
+            else:
+                if not stb & STB_ERROR_AVAILABLE:
+                    return V, A, None  # Error queue empty: skip SYSTem:ERRor?
+                return V, A, self._query_error_state()
+
+        # Query the actual measured values
+        V = self._query_float("MEASure:VOLTage?")
+        A = self._query_float("MEASure:CURRent?")
+
+        return V, A, self._query_error_state()
+
+    def _discard_input(self):
+        """
+        Drops unread reply data, e.g. the extra lines of a PSU that answers
+        each part of a compound query on its own line, so the next query does
+        not read a stale reply.
+        """
+        self.psu.timeout = PROBE_TIMEOUT_MS
+        try:
+            while True:
+                self.psu.read_raw()  # Lines still arriving after the failed read
+        except pyvisa.errors.VisaIOError:
+            pass  # Timed out: nothing more is coming
+        finally:
+            self.psu.timeout = TIMEOUT_MS
+        self.psu.flush(pyvisa.constants.BufferOperation.discard_read_buffer)
+
+    def _query_float(self, command):
+        """Queries a numeric (e.g. NR3 "+5.0000E+00") value, parsed from raw bytes."""
+        self.psu.write(command)
+        # float() parses bytes and ignores the trailing terminator itself, which
+        # beats decode + strip + float and any hand-written Python parser
+        return float(self._read_reply())
+
+    def _read_reply(self):
+        """
+        Reads one terminated reply with a single backend read.
+
+        read_raw() loops over chunks and copies them into a growing bytearray;
+        replies here are a few dozen bytes, so one READ_CHUNK_SIZE read returns
+        the whole line without the intermediate buffer.
+        """
+        data, status = self.psu.visalib.read(self.psu.session, READ_CHUNK_SIZE)
+        if status == pyvisa.constants.StatusCode.success_max_count_read:
+            data += self.psu.read_raw()  # Longer than one chunk: read the rest
+        return data
+
+    def _query_error_state(self):
+        """Returns the next SYSTem:ERRor? entry, or None if unsupported."""
+        # Query system error register (optional, helps check device health)
+        try:
+            return self.psu.query("SYSTem:ERRor?").strip()
+        except pyvisa.errors.VisaIOError:
+            # Ignore if SYSTem:ERRor is not supported
+            return None